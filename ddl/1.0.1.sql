@@ -0,0 +1,5 @@
+-- 软删除过滤（deleted_at IS NULL）配合按 updated_at 倒序是默认查询方式，建立联合索引避免全表扫描
+ALTER TABLE `user`
+    ADD KEY `deleted_at_updated_at` (`deleted_at`, `updated_at`) USING BTREE,
+    DROP KEY `account`,
+    ADD KEY `account_deleted_at` (`account`, `deleted_at`) USING BTREE;
@@ -8,6 +8,7 @@ from fastapi.exceptions import RequestValidationError
 from internal.aps_tasks import apscheduler_manager
 from internal.config.setting import setting
 from internal.constant import REDIS_KEY_LOCK_PREFIX
+from internal.infra.db import warm_up_db_pool
 from internal.utils.cache_helpers import cache
 from pkg import SYS_ENV, SYS_NAMESPACE
 from pkg.logger_tool import logger
@@ -91,6 +92,13 @@ async def lifespan(_app: FastAPI):
     cur_pid = os.getpid()
     logger.info(f"Current PID: {cur_pid}")
 
+    if setting.DB_POOL_PRE_WARM:
+        # 预热只是优化，数据库暂时不可用时不阻止启动，连接在首批请求时按需建立
+        try:
+            await warm_up_db_pool()
+        except Exception as e:
+            logger.warning(f"DB pool warm up failed, skip: {e}")
+
     is_scheduler_master = False
     if SYS_NAMESPACE in ["dev", "test", "canary", "prod"]:
         scheduler_lock_key = f"{REDIS_KEY_LOCK_PREFIX}:scheduler:master"
@@ -25,6 +25,14 @@ class BaseConfig(BaseSettings):
     MYSQL_PORT: str = "3306"
     MYSQL_DATABASE: str = "app_db"
 
+    # 数据库连接池配置，按部署的并发量调整（常见取值 pool_size 25/50/100）
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_WARM: bool = True  # 启动时预先建立 DB_POOL_SIZE 个连接
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy 编译语句缓存条目数，构建器的语句形态较多时适当调大
+
     # Redis 配置
     REDIS_HOST: str = "127.0.0.1"
     REDIS_PASSWORD: str = ""
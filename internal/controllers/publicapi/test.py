@@ -1,6 +1,5 @@
 import asyncio
 import random
-import traceback
 import uuid
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -224,7 +223,7 @@ async def test_dao():
         assert updated_user.username == updated_name
         logger.info(f"test update-2 success")
     except Exception as e:
-        logger.error(f"test dao error: {traceback.format_exc()}")
+        logger.exception(f"test dao error: {e}")
         raise AppException(code=500, detail=str(e)) from e
     else:
         return response_factory.resp_200()
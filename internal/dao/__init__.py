@@ -1,19 +1,35 @@
 """
 该目录主要用于数据库操作
 """
+from typing import AsyncGenerator
+
 from sqlalchemy import Subquery
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 
+from internal.infra.db import get_session, session_scope
 from internal.models import MixinModelType, ModelMixin
 from internal.utils.exception import AppException
 from pkg.logger_tool import logger
 from pkg.orm_tool import (CountBuilder, QueryBuilder, UpdateBuilder, new_cls_querier,
                           new_cls_updater,
                           new_col_counter, new_counter,
-                          new_ins_updater, new_sub_querier)
+                          get_by_id, new_ins_updater, new_sub_querier)
 from pkg.types import SessionProvider
 
 
+async def request_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI 依赖：同一请求内的 DAO/构建器/模型持久化操作复用一个会话，只占用一次连接池连接，请求结束时统一提交
+
+    示例:
+    @router.get("/detail", dependencies=[Depends(request_session)])
+    async def detail(user_id: int):
+        ...
+    """
+    async with session_scope(get_session) as sess:
+        yield sess
+
+
 class BaseDao:
     _model_cls: type[ModelMixin] = None
 
@@ -84,16 +100,18 @@ class BaseDao:
             creator_id: int = None,
             include_deleted: bool = False
     ) -> MixinModelType:
+        # 只按主键查询时走 identity map，同一会话内重复获取不再发出 SQL
+        if not (creator_id and self._model_cls.has_creator_id_column()):
+            return await get_by_id(
+                self._model_cls, primary_id, session_provider=self._session_provider, include_deleted=include_deleted
+            )
+
         if include_deleted:
             querier = self.querier_inc_deleted.eq_(self._model_cls.id, primary_id)
         else:
             querier = self.querier.eq_(self._model_cls.id, primary_id)
 
-        if creator_id and self._model_cls.has_creator_id_column():
-            querier = self.querier.where(
-                self._model_cls.get_creator_id_column() == creator_id
-            )
-
+        querier = querier.where(self._model_cls.get_creator_id_column() == creator_id)
         return await querier.first(include_deleted=include_deleted)
 
     async def query_by_id_or_exec(
@@ -31,10 +31,12 @@ def init_async_celery_db():
         url=setting.sqlalchemy_database_uri,
         echo=setting.sqlalchemy_echo,
         pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20,
-        pool_timeout=30,
-        pool_recycle=1800,
+        pool_size=setting.DB_POOL_SIZE,
+        max_overflow=setting.DB_MAX_OVERFLOW,
+        pool_timeout=setting.DB_POOL_TIMEOUT,
+        pool_recycle=setting.DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+        query_cache_size=setting.DB_QUERY_CACHE_SIZE,
         json_serializer=orjson_dumps,
         json_deserializer=orjson_loads
     )
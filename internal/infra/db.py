@@ -1,4 +1,6 @@
+import asyncio
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any, AsyncGenerator
 
 from redis.asyncio import ConnectionPool, Redis
@@ -9,6 +11,7 @@ from sqlalchemy.orm import declarative_base
 from internal.config.setting import setting
 from pkg import orjson_dumps, orjson_loads
 from pkg.logger_tool import logger
+from pkg.types import SessionProvider
 
 # 创建 SQLAlchemy 基类
 Base = declarative_base()
@@ -18,10 +21,12 @@ engine = create_async_engine(
     url=setting.sqlalchemy_database_uri,
     echo=False,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_recycle=1800,
+    pool_size=setting.DB_POOL_SIZE,
+    max_overflow=setting.DB_MAX_OVERFLOW,
+    pool_timeout=setting.DB_POOL_TIMEOUT,
+    pool_recycle=setting.DB_POOL_RECYCLE,
+    pool_use_lifo=True,  # 优先复用最近归还的连接，空闲连接可被 pool_recycle 自然回收
+    query_cache_size=setting.DB_QUERY_CACHE_SIZE,
     json_serializer=orjson_dumps,
     json_deserializer=orjson_loads
 )
@@ -30,8 +35,30 @@ engine = create_async_engine(
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 
+# session_scope 内共享的会话，作用域内的构建器和模型持久化方法都优先复用
+_scoped_session_var: ContextVar[AsyncSession | None] = ContextVar("scoped_session", default=None)
+
+
+def get_scoped_session() -> AsyncSession | None:
+    """当前 session_scope 中的会话，不在作用域内时返回 None"""
+    return _scoped_session_var.get()
+
+
 @asynccontextmanager
 async def get_session(autoflush: bool = True) -> AsyncGenerator[AsyncSession, Any]:
+    """orm_tool 中各构建器的执行方法都经由此处从连接池获取连接，池大小见 DB_POOL_SIZE/DB_MAX_OVERFLOW
+
+    在 request_session/session_scope 作用域内直接返回作用域的会话，提交、回滚和关闭都由作用域负责
+    """
+    scoped = _scoped_session_var.get()
+    if scoped is not None:
+        if autoflush:
+            yield scoped
+        else:
+            with scoped.no_autoflush:
+                yield scoped
+        return
+
     async with AsyncSessionLocal() as session:
         if autoflush:
             try:
@@ -50,6 +77,67 @@ async def get_session(autoflush: bool = True) -> AsyncGenerator[AsyncSession, An
                     raise e
 
 
+@asynccontextmanager
+async def session_scope(session_provider: SessionProvider) -> AsyncGenerator[AsyncSession, None]:
+    """在同一个会话/事务中执行多个数据库操作
+
+    作用域内的构建器以及 ModelMixin 的 save/update/soft_delete/add_all_* 复用同一个会话，
+    不再各自从连接池获取连接，退出作用域时统一提交
+    示例:
+    async with session_scope(get_session):
+        user = await user_dao.querier.eq_(User.id, 1).first()
+        await user.update(username="Alice")
+
+    嵌套使用时内层直接复用外层会话，由最外层统一提交
+    """
+    outer = _scoped_session_var.get()
+    if outer is not None:
+        yield outer
+        return
+
+    async with session_provider() as sess:
+        token = _scoped_session_var.set(sess)
+        try:
+            yield sess
+            await sess.commit()
+        finally:
+            _scoped_session_var.reset(token)
+
+
+@asynccontextmanager
+async def resolve_session(
+        session_provider: SessionProvider,
+        *,
+        commit: bool = False
+) -> AsyncGenerator[AsyncSession, None]:
+    """获取执行用的会话：优先复用 session_scope 中的会话，否则由 session_provider 新建
+
+    Args:
+        session_provider: 不在 session_scope 内时用于新建会话
+        commit: 新建会话时是否在退出前提交，共享会话统一由 session_scope 提交
+    """
+    sess = _scoped_session_var.get()
+    if sess is not None:
+        yield sess
+        return
+
+    async with session_provider() as sess:
+        yield sess
+        if commit:
+            await sess.commit()
+
+
+async def warm_up_db_pool():
+    """预热连接池：并发建立 pool_size 个连接后归还，避免首批请求承担建连开销"""
+
+    async def _checkout():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_checkout() for _ in range(setting.DB_POOL_SIZE)))
+    logger.info(f"DB pool warmed up, size={setting.DB_POOL_SIZE}")
+
+
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     try:
         compiled_statement = statement
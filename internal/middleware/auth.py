@@ -1,6 +1,4 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from internal.core.auth_token import verify_token
 from pkg.signature_tool import signature_auth_helper
@@ -8,7 +6,7 @@ from pkg.context_tool import set_user_id_context_var
 from pkg.logger_tool import logger
 from pkg.resp_tool import response_factory
 
-auth_token_white = [
+auth_token_white: frozenset[str] = frozenset({
     "/auth/login",
     "/auth/register",
     "/docs",
@@ -16,44 +14,78 @@ auth_token_white = [
     "/v1/auth/login_by_account",
     "/v1/auth/login_by_phone",
     "/v1/auth/verify_token"
-]
+})
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        url_path = request.url.path
+def _read_auth_headers(scope: Scope) -> tuple[str, str | None, str | None, str | None]:
+    """一次遍历原始请求头取出 (token, x_signature, x_timestamp, x_nonce)，header 名在 ASGI 中已是小写 bytes"""
+    token = ""
+    x_signature = x_timestamp = x_nonce = None
+    for key, value in scope["headers"]:
+        if key == b"authorization":
+            token = value.decode("latin-1")
+        elif key == b"x-signature":
+            x_signature = value.decode("latin-1")
+        elif key == b"x-timestamp":
+            x_timestamp = value.decode("latin-1")
+        elif key == b"x-nonce":
+            x_nonce = value.decode("latin-1")
+    return token, x_signature, x_timestamp, x_nonce
+
+
+class AuthMiddleware:
+    """纯 ASGI 认证中间件，直接从 scope 读取路径和请求头，不经过 BaseHTTPMiddleware 的任务组和流转发"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        url_path = scope["path"]
         if url_path.startswith("/api/v1/public"):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         if url_path in auth_token_white or url_path.startswith("/test"):
             logger.info(f"skip auth: {url_path}")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        token, x_signature, x_timestamp, x_nonce = _read_auth_headers(scope)
 
         if url_path.startswith("/v1/internal"):
-            x_signature = request.headers.get("X-Signature")
-            x_timestamp = request.headers.get("X-Timestamp")
-            x_nonce = request.headers.get("X-Nonce")
-            if not await signature_auth_helper.verify(signature=x_signature, timestamp=x_timestamp, nonce=x_nonce):
-                return response_factory.resp_401(
-                    msg=f"signature_auth failed, x_signature={x_signature}, x_timestamp={x_timestamp}, x_nonce={x_nonce}"
+            if not signature_auth_helper.verify(x_signature=x_signature, x_timestamp=x_timestamp, x_nonce=x_nonce):
+                response = response_factory.resp_401(
+                    message=f"signature_auth failed, x_signature={x_signature}, x_timestamp={x_timestamp}, x_nonce={x_nonce}"
                 )
-            return await call_next(request)
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
 
         # token 校验
-        token = request.headers.get("Authorization", "")
         if token == "":
             logger.warning("get empty token from Authorization")
-            return response_factory.resp_401(message="invalid or missing token")
+            response = response_factory.resp_401(message="invalid or missing token")
+            await response(scope, receive, send)
+            return
 
         logger.info(f"verify token: {token}")
         user_data, ok = await verify_token(token)
         if not ok:
-            return response_factory.resp_401(message="invalid or missing token")
+            response = response_factory.resp_401(message="invalid or missing token")
+            await response(scope, receive, send)
+            return
 
         user_id = user_data.get("id")
         if not user_id:
-            return response_factory.resp_401(message="invalid or missing token, user_id is None")
+            response = response_factory.resp_401(message="invalid or missing token, user_id is None")
+            await response(scope, receive, send)
+            return
 
         logger.info(f"set user_id to context: {user_id}")
         set_user_id_context_var(user_id)
-        return await call_next(request)
+        await self.app(scope, receive, send)
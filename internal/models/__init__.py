@@ -1,10 +1,11 @@
 """该目录主要用于数据库模型"""
+from operator import attrgetter
 from typing import TypeVar
 
-from sqlalchemy import BigInteger, Column, DateTime
+from sqlalchemy import BigInteger, Column, DateTime, event, inspect
 from sqlalchemy.orm import InstrumentedAttribute
 
-from internal.infra.db import Base, get_session
+from internal.infra.db import Base, get_session, resolve_session
 from pkg.context_tool import get_user_id_context_var
 from pkg import get_utc_without_tzinfo
 from pkg.logger_tool import logger
@@ -22,6 +23,22 @@ class ModelMixin(Base):
     updated_at = Column(DateTime(timezone=False), nullable=True, default=None, server_default=None)
     deleted_at = Column(DateTime(timezone=False), nullable=True, default=None, server_default=None)
 
+    # 字段元数据，映射完成后由 _cache_model_columns 填充，避免构建语句时按名称反射
+    _column_names: frozenset[str] = frozenset()
+    _column_tuple: tuple[str, ...] = ()
+    _column_getter: attrgetter | None = None
+    _has_deleted_at: bool = False
+    _has_updated_at: bool = False
+    _has_creator_id: bool = False
+    _has_updater_id: bool = False
+    _id_col = None
+    _deleted_at_col = None
+    _updated_at_col = None
+    _deleted_at_name: str | None = None
+    _updated_at_name: str | None = None
+    _creator_id_name: str | None = None
+    _updater_id_name: str | None = None
+
     @classmethod
     async def add_all_dict(
             cls,
@@ -33,9 +50,9 @@ class ModelMixin(Base):
 
         ins_list = [cls.create(**item) for item in items]
         try:
-            async with session_provider() as sess:
-                async with sess.begin():
-                    sess.add_all(ins_list)
+            async with resolve_session(session_provider, commit=True) as sess:
+                sess.add_all(ins_list)
+                await sess.flush()
         except Exception as e:
             logger.error(f"{cls.__name__} add_all_dict failed, error={e}")
             raise e
@@ -50,18 +67,18 @@ class ModelMixin(Base):
             return
 
         try:
-            async with session_provider() as sess:
-                async with sess.begin():
-                    sess.add_all(ins_list)
+            async with resolve_session(session_provider, commit=True) as sess:
+                sess.add_all(ins_list)
+                await sess.flush()
         except Exception as e:
             logger.error(f"{cls.__name__} add_all_ins failed, error={e}")
             raise e
 
     async def save(self, session_provider: SessionProvider = get_session):
         try:
-            async with session_provider() as sess:
+            async with resolve_session(session_provider, commit=True) as sess:
                 sess.add(self)
-                await sess.commit()
+                await sess.flush()
         except Exception as e:
             logger.error(f"{self.__class__.__name__} save error: {e}")
             raise e
@@ -71,23 +88,22 @@ class ModelMixin(Base):
             session_provider: SessionProvider = get_session,
             **kwargs
     ):
+        column_names = self._column_names
         for column_name, value in kwargs.items():
-            if not self.has_column(column_name):
+            if column_name not in column_names:
                 continue
             setattr(self, column_name, value)
 
-        if hasattr(self, self.updated_at_column_name()):
-            cur_datetime = get_utc_without_tzinfo()
-            setattr(self, self.updated_at_column_name(), cur_datetime)
+        if self._updated_at_name is not None:
+            setattr(self, self._updated_at_name, get_utc_without_tzinfo())
 
-        if self.has_updater_id_column():
-            user_id = get_user_id_context_var()
-            setattr(self, self.updater_id_column_name(), user_id)
+        if self._updater_id_name is not None:
+            setattr(self, self._updater_id_name, get_user_id_context_var())
 
         try:
-            async with session_provider() as sess:
+            async with resolve_session(session_provider, commit=True) as sess:
                 sess.add(self)
-                await sess.commit()
+                await sess.flush()
         except Exception as e:
             logger.error(f"{self.__class__.__name__} update error: {e}")
             raise e
@@ -104,31 +120,45 @@ class ModelMixin(Base):
 
         if "id" not in kwargs:
             instance.id = generate_snowflake_id()
-        if instance.has_creator_id_column():
-            user_id = get_user_id_context_var()
-            setattr(instance, instance.creator_id_column_name(), user_id)
-        if instance.has_updater_id_column():
-            setattr(instance, instance.updater_id_column_name(), None)
+        if cls._creator_id_name is not None:
+            setattr(instance, cls._creator_id_name, get_user_id_context_var())
+        if cls._updater_id_name is not None:
+            setattr(instance, cls._updater_id_name, None)
 
         instance.populate(**kwargs)
         return instance
 
     def populate(self, **kwargs):
+        column_names = self._column_names
         for column_name, value in kwargs.items():
-            if not self.has_column(column_name):
+            if column_name not in column_names:
                 # logger.warning(f"Column '{column_name}' does not exist in model '{self.__class__.__name__}'")
                 continue
             setattr(self, column_name, value)
 
     def to_dict(self, *, exclude_column: list[str] = None) -> dict:
-        d = {}
-        for column_name in self.get_column_names():
-            if exclude_column and column_name in exclude_column:
-                continue
-
-            val = getattr(self, column_name)
-            d[column_name] = val
-        return d
+        column_tuple = self._column_tuple
+        if self._column_names <= self.__dict__.keys():
+            if not exclude_column:
+                # 一次 attrgetter 调用取出全部字段值
+                return dict(zip(column_tuple, self._column_getter(self)))
+            return {
+                column_name: getattr(self, column_name)
+                for column_name in column_tuple
+                if column_name not in exclude_column
+            }
+
+        # 有列不在实例中：新建实例中未赋值的列取默认值；load_only_/defer_ 查询出的记录跳过未加载的列，
+        # 已过期的列仍照常访问，不静默丢弃
+        state = inspect(self)
+        skipped = ()
+        if state.has_identity:
+            skipped = self._column_names - self.__dict__.keys() - state.expired_attributes
+        return {
+            column_name: getattr(self, column_name)
+            for column_name in column_tuple
+            if column_name not in skipped and (not exclude_column or column_name not in exclude_column)
+        }
 
     def clone(self) -> "ModelMixin":
         excluded_columns = ["updater_id", "creator_id", "updated_at", "deleted_at", "id"]
@@ -161,26 +191,26 @@ class ModelMixin(Base):
     @classmethod
     def has_deleted_at_column(cls) -> bool:
         """判断是否有删除时间字段"""
-        return cls.has_column(cls.deleted_at_column_name())
+        return cls._has_deleted_at
 
     @classmethod
     def has_updated_at_column(cls):
-        return cls.has_column(cls.updated_at_column_name())
+        return cls._has_updated_at
 
     @classmethod
     def has_creator_id_column(cls) -> bool:
         """判断是否有创建人字段"""
-        return cls.has_column(cls.creator_id_column_name())
+        return cls._has_creator_id
 
     @classmethod
     def has_updater_id_column(cls) -> bool:
         """判断是否有更新人字段"""
-        return cls.has_column(cls.updater_id_column_name())
+        return cls._has_updater_id
 
     @classmethod
     def has_column(cls, column_name: str) -> bool:
         """判断是否为真实数据库字段"""
-        return column_name in cls.__table__.columns
+        return column_name in cls._column_names
 
     @classmethod
     def get_column_names(cls) -> list[str]:
@@ -192,7 +222,7 @@ class ModelMixin(Base):
 
     @classmethod
     def get_column_or_raise(cls, column_name: str) -> InstrumentedAttribute:
-        if column_name not in cls.__table__.columns:
+        if column_name not in cls._column_names:
             raise ValueError(
                 f"{column_name} is not a real table column of {cls.__name__}"
             )
@@ -203,4 +233,29 @@ class ModelMixin(Base):
         return cls.get_column_or_none(cls.creator_id_column_name())
 
 
+@event.listens_for(ModelMixin, "after_mapper_constructed", propagate=True)
+def _cache_model_columns(_mapper, cls: type[ModelMixin]):
+    """模型类映射完成后缓存常用字段，每个模型只执行一次"""
+    cls._column_tuple = tuple(cls.get_column_names())
+    cls._column_names = frozenset(cls._column_tuple)
+    # 字段数恒大于 1（含 ModelMixin 的公共字段），attrgetter 总是返回元组
+    cls._column_getter = attrgetter(*cls._column_tuple)
+    cls._has_deleted_at = cls.deleted_at_column_name() in cls._column_names
+    cls._has_updated_at = cls.updated_at_column_name() in cls._column_names
+    cls._has_creator_id = cls.creator_id_column_name() in cls._column_names
+    cls._has_updater_id = cls.updater_id_column_name() in cls._column_names
+
+    cls._id_col = cls.get_column_or_none("id") if cls.has_column("id") else None
+    cls._deleted_at_col = (
+        cls.get_column_or_none(cls.deleted_at_column_name()) if cls.has_deleted_at_column() else None
+    )
+    cls._updated_at_col = (
+        cls.get_column_or_none(cls.updated_at_column_name()) if cls.has_updated_at_column() else None
+    )
+    cls._deleted_at_name = cls.deleted_at_column_name() if cls.has_deleted_at_column() else None
+    cls._updated_at_name = cls.updated_at_column_name() if cls.has_updated_at_column() else None
+    cls._creator_id_name = cls.creator_id_column_name() if cls.has_creator_id_column() else None
+    cls._updater_id_name = cls.updater_id_column_name() if cls.has_updater_id_column() else None
+
+
 MixinModelType = TypeVar("MixinModelType", bound=ModelMixin)  # 定义一个泛型变量 T，继承自 ModelMixin
@@ -16,6 +16,7 @@ class AppException(Exception):
 
 
 def get_last_exec_tb(exc: Exception, lines: int = 3) -> str:
-    tb_lines = traceback.format_exception(type(exc), exc, exc.__traceback__)
+    # limit 取负数只格式化最后几层栈帧，不必格式化整个调用栈后再截取
+    tb_lines = traceback.format_exception(type(exc), exc, exc.__traceback__, limit=-lines)
     last_5_lines = tb_lines[-lines:] if len(tb_lines) >= lines else tb_lines
     return "\n".join(last_5_lines)
@@ -1,16 +1,16 @@
 import datetime
-import hashlib
 import os
 import random
 import re
 import string
 import time
 import uuid
+from itertools import chain
 from pathlib import Path
 from urllib.parse import urlencode, urlunparse
+from zoneinfo import ZoneInfo
 
 import orjson
-import pytz
 import shortuuid
 import xxhash
 
@@ -63,7 +63,7 @@ def datetime_to_string(val: datetime.datetime) -> str:
         return val.isoformat()
     else:
         # 没有时区信息，添加 'Z' 表示 UTC 时间
-        return val.replace(tzinfo=pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return val.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 # 将字符串转换为 datetime 对象
@@ -82,6 +82,9 @@ def iso_to_datetime(iso_string: str) -> datetime.datetime:
         raise ValueError(f"Invalid ISO format string: {iso_string}") from e
 
 
+_SHANGHAI_TZ = ZoneInfo("Asia/Shanghai")
+
+
 def convert_to_utc(val: datetime.datetime) -> datetime.datetime:
     """
     将没有时区信息的东八区时间转换为 UTC 时间
@@ -94,10 +97,10 @@ def convert_to_utc(val: datetime.datetime) -> datetime.datetime:
     """
     # 如果没有时区信息，假定为东八区时间
     if val.tzinfo is None:
-        val = pytz.timezone('Asia/Shanghai').localize(val)
+        val = val.replace(tzinfo=_SHANGHAI_TZ)
 
     # 转换为 UTC 时间并移除时区信息
-    return val.astimezone(pytz.utc)
+    return val.astimezone(datetime.UTC)
 
 
 def hash_to_int(data: str) -> int:
@@ -155,7 +158,9 @@ def parse_datetime_from_str(s: str) -> datetime.datetime | None:
 
 # 取两个列表不同的元素，比如[1, 2, 3], [3, 4, 5] => [1, 2, 4, 5]
 def diff_list(a: list, b: list) -> list:
-    return list(set(a).symmetric_difference(set(b)))
+    """两个列表的对称差集，去重并保持 a、b 中的出现顺序"""
+    set_a, set_b = set(a), set(b)
+    return list(dict.fromkeys(chain((x for x in a if x not in set_b), (x for x in b if x not in set_a))))
 
 
 # 列表去重
@@ -177,15 +182,19 @@ def unique_iterable(iterable: list | tuple | set) -> list:
 
 # 合并列表
 def merge_list(a: list, b: list) -> list:
-    return list(set(a).union(set(b)))
+    """合并两个列表，去重并保持 a、b 中的出现顺序"""
+    return list(dict.fromkeys(chain(a, b)))
+
+
+_ALPHANUMERIC = string.ascii_letters + string.digits
 
 
 def unique_string_w_timestamp() -> str:
     """
     使用时间戳和随机数生成唯一字符串。
     """
-    timestamp = str(int(time.time() * 1e6))  # 精确到微秒的时间戳
-    random_part = ''.join(random.choices(string.ascii_letters + string.digits, k=6))
+    timestamp = str(time.time_ns() // 1000)  # 精确到微秒的时间戳，整数运算避免浮点乘法和精度损失
+    random_part = ''.join(random.choices(_ALPHANUMERIC, k=6))
     return timestamp + random_part
 
 
@@ -199,16 +208,8 @@ def deep_compare_dict(d1, d2):
     if not (isinstance(d1, dict) and isinstance(d2, dict)):
         return False
 
-    if d1.keys() != d2.keys():
-        return False
-
-    for key in d1:
-        if isinstance(d1[key], dict) and isinstance(d2[key], dict):
-            if not deep_compare_dict(d1[key], d2[key]):
-                return False
-        elif d1[key] != d2[key]:
-            return False
-    return True
+    # dict 的 == 本身就会在 C 层递归比较嵌套的 dict 和各个值，无需在 Python 中逐层遍历
+    return d1 == d2
 
 
 def token_cache_key(token: str) -> str:
@@ -228,29 +229,22 @@ def create_uuid_token():
     return shortuuid.uuid()
 
 
+# 正则表达式：以1开头，第二位是3-9之间的数字，后面是9个数字，模块加载时预编译
+_PHONE_NUMBER_PATTERN = re.compile(r"^1[3-9]\d{9}$")
+
+
 def validate_phone_number(phone: str) -> bool:
     """
     校验手机号是否符合中国大陆的手机号格式
     :param phone: 待验证的手机号字符串
     :return: 如果手机号格式正确，返回 True，否则返回 False
     """
-    # 正则表达式：以1开头，第二位是3-9之间的数字，后面是9个数字
-    pattern = r"^1[3-9]\d{9}$"
-
-    if re.match(pattern, phone):
-        return True
-    else:
-        return False
+    return _PHONE_NUMBER_PATTERN.match(phone) is not None
 
 
 def generate_account_by_phone(phone_number: str) -> str:
-    # 选择哈希算法（例如 SHA-256）
-    hashed_phone = hashlib.sha256(phone_number.encode('utf-8')).hexdigest()
-
-    # 为了增加唯一性，也可以使用 UUID 来保证生成的 ID 是唯一的
-    unique_account_id = f"user_{hashed_phone}"
-
-    return unique_account_id
+    # 账号只是由手机号确定性生成的标识，不需要密码学强度，使用非加密哈希 xxh128
+    return f"user_{xxhash.xxh128_hexdigest(phone_number.encode('utf-8'))}"
 
 
 def build_url(
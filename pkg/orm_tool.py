@@ -1,12 +1,16 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator
 
 from sqlalchemy import (Column, ColumnExpressionArgument, Delete, Function, Select, Subquery, Update,
-                        distinct, func, or_,
+                        and_, distinct, func, or_,
                         select, update)
-from sqlalchemy.orm import InstrumentedAttribute, aliased
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased, defer, load_only
 from sqlalchemy.sql.elements import ClauseElement, ColumnElement
 
+from internal.infra.db import get_scoped_session, resolve_session
 from internal.models import MixinModelType, ModelMixin
 from pkg import get_utc_without_tzinfo, unique_list
 from pkg.context_tool import get_user_id_context_var
@@ -14,10 +18,83 @@ from pkg.logger_tool import logger
 from pkg.types import SessionProvider
 
 
+def _naive_datetime(value: Any) -> Any:
+    """带时区的 datetime 去掉时区信息，其余值原样返回"""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _blank_select(model_cls: type[ModelMixin], soft_delete: bool) -> Select:
+    """按 (模型类, 是否过滤软删除记录) 缓存基础查询语句
+
+    SQLAlchemy 语句是生成式的，后续 .where() 等调用会返回新对象，缓存的语句本身不会被修改
+    """
+    stmt = select(model_cls)
+    if soft_delete:
+        stmt = stmt.where(model_cls._deleted_at_col.is_(None))
+    return stmt
+
+
+@lru_cache(maxsize=None)
+def _blank_update(model_cls: type[ModelMixin]) -> Update:
+    """按模型类缓存基础更新语句，synchronize_session 在此一次性设置，执行时无需再复制语句"""
+    return update(model_cls).execution_options(synchronize_session=False)
+
+
+@lru_cache(maxsize=None)
+def _blank_count_all(model_cls: type[ModelMixin]) -> Select:
+    """按模型类缓存 COUNT(*) 计数语句"""
+    return select(func.count()).select_from(model_cls)
+
+
+def _build_count(count_column: ColumnElement, is_distinct: bool) -> Select:
+    """构建基础计数语句"""
+    if is_distinct:
+        expression: Function[Column] = func.count(distinct(count_column))
+    else:
+        expression: Function[Column] = func.count(count_column)
+    return select(expression)
+
+
+@lru_cache(maxsize=None)
+def _blank_count(count_column: InstrumentedAttribute, is_distinct: bool) -> Select:
+    """按 (模型字段, 是否去重) 缓存基础计数语句，只用于模型类上声明的字段，条目数不超过模型字段数的两倍"""
+    return _build_count(count_column, is_distinct)
+
+
+def _is_mapped_attribute(column: Any) -> bool:
+    """是否为模型类上声明的字段，别名类的字段和临时表达式每次都是新对象，不适合作为缓存键"""
+    return isinstance(column, InstrumentedAttribute) and column.parent.is_mapper
+
+
+_SYNC_SESSION: dict = {"synchronize_session": "auto"}
+_NO_SYNC_SESSION: dict = {}
+
+
+def _sync_options(sess: AsyncSession) -> dict:
+    """UPDATE 的执行选项：会话中已有对象时（session_scope/bind 的共享会话）同步更新 identity map，
+    避免同一会话后续读到旧值；新建的空会话沿用 _blank_update 中的 synchronize_session=False"""
+    if sess.identity_map or sess.new:
+        return _SYNC_SESSION
+    return _NO_SYNC_SESSION
+
+
+async def _expunge_rows(sess: AsyncSession, result: AsyncScalarResult) -> AsyncGenerator[Any, None]:
+    """逐条返回结果，返回前将记录移出流式读取的会话"""
+    async for row in result:
+        sess.expunge(row)
+        yield row
+
+
 class BaseBuilder:
     """SQL查询构建器基类，提供模型类和方法的基本结构"""
 
-    __slots__ = ("_model_cls", "_stmt", "_session_provider")  # 优化内存使用
+    __slots__ = (
+        "_model_cls", "_stmt", "_session_provider", "_sess", "_soft_delete_applied",
+        "_pending_where", "_pending_group_by", "_pending_order_by", "_grouped_by"
+    )  # 优化内存使用
 
     def __init__(
             self,
@@ -34,12 +111,38 @@ class BaseBuilder:
         Raises:
             TypeError: 如果 model_class 不是有效的模型类
         """
-        if not isinstance(model_cls, type) or not issubclass(model_cls, ModelMixin):
-            raise Exception(f"model_class must be a subclass of ModelMixin, and actually gets: {type(model_cls)}")
+        _validate_model_cls(model_cls)
 
         self._model_cls: type[MixinModelType] = model_cls
         self._stmt: Select | Delete | Update | None = None
         self._session_provider = session_provider
+        self._sess: AsyncSession | None = None
+        self._soft_delete_applied = False
+        # 链式调用中的条件先缓存，执行或取语句时一次性应用，避免每次调用都复制语句
+        self._pending_where: list[ClauseElement] = []
+        self._pending_group_by: list[ColumnElement] = []
+        self._pending_order_by: list[ColumnElement] = []
+        # 通过 group_by_ 添加过的全部分组列，用于去重，不随 _apply_pending 清空
+        self._grouped_by: list[ColumnElement] = []
+
+    def bind(self, sess: AsyncSession) -> "BaseBuilder":
+        """绑定外部会话，执行时复用该会话，提交由外部负责"""
+        self._sess = sess
+        return self
+
+    @asynccontextmanager
+    async def _session(self, *, commit: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """获取执行用的会话：优先使用绑定的会话，其余同 resolve_session
+
+        Args:
+            commit: 新建会话时是否在退出前提交，共享会话统一由外部提交
+        """
+        if self._sess is not None:
+            yield self._sess
+            return
+
+        async with resolve_session(self._session_provider, commit=commit) as sess:
+            yield sess
 
     # 单独的操作符方法
     def eq_(self, column: InstrumentedAttribute, value: Any) -> "BaseBuilder":
@@ -91,15 +194,22 @@ class BaseBuilder:
         return self.where(column.notin_(unique_values))
 
     def like(self, column: InstrumentedAttribute, pattern: str) -> "BaseBuilder":
-        """模糊匹配条件"""
-        return self.where(column.like(f"%{pattern}%"))
+        """模糊匹配条件，pattern 中的 % 和 _ 会被转义"""
+        return self.where(column.contains(pattern, autoescape=True))
 
     def ilike(self, column: InstrumentedAttribute, pattern: str) -> "BaseBuilder":
-        """忽略大小写的模糊匹配条件"""
-        return self.where(column.ilike(f"%{pattern}%"))
+        """忽略大小写的模糊匹配条件，pattern 中的 % 和 _ 会被转义"""
+        return self.where(column.icontains(pattern, autoescape=True))
+
+    def like_raw(self, column: InstrumentedAttribute, pattern: str) -> "BaseBuilder":
+        """原始 LIKE 条件，pattern 需自行包含通配符，例如 abc%"""
+        return self.where(column.like(pattern))
 
     def is_null(self, column: InstrumentedAttribute) -> "BaseBuilder":
         """为空检查条件"""
+        if self._soft_delete_applied and column is self._model_cls._deleted_at_col:
+            logger.debug(f"{self._model_cls.__name__} soft delete filter already applied, skip duplicate is_null")
+            return self
         return self.where(column.is_(None))
 
     def is_not_null(self, column: InstrumentedAttribute) -> "BaseBuilder":
@@ -133,7 +243,11 @@ class BaseBuilder:
         if not conditions:
             return self
 
-        self._stmt = self._stmt.where(or_(*conditions))
+        # 单个条件无需 OR 包装
+        if len(conditions) == 1:
+            return self.where(conditions[0])
+
+        self._pending_where.append(or_(*conditions))
         return self
 
     def distinct_(self, *cols: InstrumentedAttribute) -> "BaseBuilder":
@@ -164,24 +278,51 @@ class BaseBuilder:
         Returns:
             QueryBuilder: 自身实例，支持链式调用
         """
+        # 跳过已在 GROUP BY 中的列，包括同一次调用中重复传入的列
+        grouped = self._grouped_by
+        for col in cols:
+            expression = col.expression
+            if any(expression.compare(e) for e in grouped):
+                continue
+            grouped.append(expression)
+            self._pending_group_by.append(expression)
+        return self
+
+    def desc_(self, *cols: InstrumentedAttribute) -> "BaseBuilder":
+        """按列降序排序，多个列在一次 order_by 中添加"""
         if not cols:
             return self
 
-        self._stmt = self._stmt.group_by(*cols)
+        self._pending_order_by.extend(col.desc() for col in cols)
         return self
 
-    def desc_(self, col: InstrumentedAttribute) -> "BaseBuilder":
-        self._stmt = self._stmt.order_by(col.desc())
-        return self
+    def asc_(self, *cols: InstrumentedAttribute) -> "BaseBuilder":
+        """按列升序排序，多个列在一次 order_by 中添加"""
+        if not cols:
+            return self
 
-    def asc_(self, col: InstrumentedAttribute) -> "BaseBuilder":
-        self._stmt = self._stmt.order_by(col.asc())
+        self._pending_order_by.extend(col.asc() for col in cols)
         return self
 
     def _apply_delete_at_is_none(self) -> None:
-        """安全地添加软删除过滤条件"""
-        deleted_column = self._model_cls.get_column_or_none(self._model_cls.deleted_at_column_name())
-        self._stmt = self._stmt.where(deleted_column.is_(None))
+        """安全地添加软删除过滤条件，已添加过则跳过"""
+        if self._soft_delete_applied:
+            return
+
+        self._pending_where.append(self._model_cls._deleted_at_col.is_(None))
+        self._soft_delete_applied = True
+
+    def _apply_pending(self) -> None:
+        """将缓存的 WHERE / GROUP BY / ORDER BY 一次性应用到语句上，每类子句只复制一次语句"""
+        if self._pending_where:
+            self._stmt = self._stmt.where(*self._pending_where)
+            self._pending_where.clear()
+        if self._pending_group_by:
+            self._stmt = self._stmt.group_by(*self._pending_group_by)
+            self._pending_group_by.clear()
+        if self._pending_order_by:
+            self._stmt = self._stmt.order_by(*self._pending_order_by)
+            self._pending_order_by.clear()
 
     def where(self, *conditions: ClauseElement) -> "BaseBuilder":
         """
@@ -197,11 +338,12 @@ class BaseBuilder:
         if not conditions:
             return self
 
-        self._stmt = self._stmt.where(*conditions)
+        self._pending_where.extend(conditions)
         return self
 
 
 class QueryBuilder(BaseBuilder):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -221,37 +363,38 @@ class QueryBuilder(BaseBuilder):
             initial_where: 初始WHERE条件 (可选)
 
         Raises:
-            ValueError: 如果模型类无效
+            TypeError: 如果模型类无效
         """
         super().__init__(model_cls=model_cls, session_provider=session_provider)
 
         if custom_stmt is not None:
             self._stmt: Select = custom_stmt
         else:
-            # 基础查询语句
-            self._stmt: Select = select(self._model_cls)
-
-            # 默认过滤已删除记录
-            if include_deleted is False and self._model_cls.has_deleted_at_column:
-                self._apply_delete_at_is_none()
+            # 基础查询语句（默认过滤已删除记录），按模型类缓存
+            soft_delete = include_deleted is False and self._model_cls._deleted_at_col is not None
+            self._stmt: Select = _blank_select(self._model_cls, soft_delete)
+            self._soft_delete_applied = soft_delete
 
             # 添加初始WHERE条件
             if initial_where is not None:
-                self._stmt = self._stmt.where(initial_where)
+                self._pending_where.append(initial_where)
 
     @property
     def select_stmt(self) -> Select:
+        self._apply_pending()
         return self._stmt
 
     @property
     def subquery_stmt(self) -> Subquery:
+        self._apply_pending()
         return self._stmt.subquery()
 
     async def all(self, *, include_deleted: bool | None = None) -> list[MixinModelType]:
-        if include_deleted is False and self._model_cls.has_deleted_at_column:
+        if include_deleted is False and self._model_cls._has_deleted_at:
             self._apply_delete_at_is_none()
+        self._apply_pending()
 
-        async with self._session_provider() as sess:
+        async with self._session() as sess:
             try:
                 result = await sess.execute(self._stmt)
                 data = result.scalars().all()
@@ -260,30 +403,124 @@ class QueryBuilder(BaseBuilder):
                 raise
         return data
 
+    @asynccontextmanager
+    async def stream_all(
+            self,
+            *,
+            include_deleted: bool | None = None,
+            yield_per: int = 500
+    ) -> AsyncGenerator[AsyncIterator[MixinModelType], None]:
+        """流式读取结果，每次从数据库取 yield_per 行，避免大结果集一次性加载到内存
+
+        以异步上下文管理器返回结果流，退出时关闭游标并归还会话，循环中提前 break 也不会占用连接。
+        流式读取始终使用单独的会话：MySQL 服务端游标未关闭前同一连接不能执行其它语句，
+        因此不复用 session_scope/bind 的会话（在其引擎上另开一个），逐条返回的记录已脱离该会话，
+        循环中可直接调用 update 等方法，写入仍走作用域的会话
+        示例:
+        async with user_dao.querier.stream_all(yield_per=1000) as users:
+            async for user in users:
+                await user.update(username="Alice")
+        """
+        if include_deleted is False and self._model_cls._has_deleted_at:
+            self._apply_delete_at_is_none()
+        self._apply_pending()
+
+        shared = self._sess or get_scoped_session()
+        if shared is None:
+            session_cm = self._session_provider()
+        else:
+            session_cm = AsyncSession(bind=shared.bind, expire_on_commit=False)
+
+        async with session_cm as sess:
+            try:
+                result = await sess.stream_scalars(self._stmt.execution_options(yield_per=yield_per))
+            except Exception as e:
+                logger.error(f"{self._model_cls.__name__} stream all error: {e}")
+                raise
+
+            rows = _expunge_rows(sess, result)
+            try:
+                yield rows
+            finally:
+                await rows.aclose()
+                await result.close()
+
     async def first(self, *, include_deleted: bool | None = None) -> MixinModelType | None:
-        if include_deleted is False and self._model_cls.has_deleted_at_column:
+        if include_deleted is False and self._model_cls._has_deleted_at:
             self._apply_delete_at_is_none()
+        self._apply_pending()
 
-        async with self._session_provider() as sess:
+        async with self._session() as sess:
             try:
-                result = await sess.execute(self._stmt)
-                data = result.scalars().first()
+                # 在 SQL 层限制只取一行，避免传输多余数据
+                result = await sess.execute(self._stmt.limit(1))
+                data = result.scalars().one_or_none()
             except Exception as e:
                 logger.error(f"{self._model_cls.__name__} get first error: {e}")
                 raise
         return data
 
     def paginate(self, *, page: int | None = None, limit: int | None = None) -> "QueryBuilder":
-        if page and limit:
-            self._stmt = self._stmt.offset((page - 1) * limit).limit(limit)
+        if not page or not limit or limit <= 0:
+            return self
+
+        # 第一页不生成 OFFSET 0；其余页用 slice 一次设置 LIMIT/OFFSET，只复制一次语句
+        if page > 1:
+            self._stmt = self._stmt.slice((page - 1) * limit, page * limit)
+        else:
+            self._stmt = self._stmt.limit(limit)
         return self
 
     def limit(self, limit: int) -> "QueryBuilder":
         self._stmt = self._stmt.limit(limit)
         return self
 
+    def join_(
+            self,
+            target: type[ModelMixin],
+            onclause: ColumnExpressionArgument,
+            *,
+            isouter: bool = False,
+            include_deleted: bool = False
+    ) -> "QueryBuilder":
+        """
+        关联查询，被关联表的软删除过滤条件放在 ON 子句中，而不是顶层 WHERE
+
+        左连接时放在 ON 中才能保留主表记录，内连接时也便于数据库在连接阶段提前过滤
+        示例:
+        builder.join_(Order, Order.user_id == User.id, isouter=True)
+        """
+        if include_deleted is False and target._has_deleted_at:
+            onclause = and_(onclause, target._deleted_at_col.is_(None))
+
+        self._stmt = self._stmt.join(target, onclause, isouter=isouter)
+        return self
+
+    def load_only_(self, *cols: InstrumentedAttribute) -> "QueryBuilder":
+        """只加载指定列，减少大字段的传输和对象构造
+
+        会话在执行后即关闭，其余列不会再补查，访问时直接抛出异常；to_dict 会跳过未加载的列
+        示例:
+        builder.load_only_(User.id, User.username)
+        """
+        if not cols:
+            return self
+
+        self._stmt = self._stmt.options(load_only(*cols, raiseload=True))
+        return self
+
+    def defer_(self, *cols: InstrumentedAttribute) -> "QueryBuilder":
+        """不加载指定列，适用于只排除少数大字段的场景，未加载列的访问限制同 load_only_"""
+        if not cols:
+            return self
+
+        self._stmt = self._stmt.options(*(defer(col, raiseload=True) for col in cols))
+        return self
+
 
 class CountBuilder(BaseBuilder):
+    __slots__ = ()
+
     def __init__(
             self,
             model_cls: type[ModelMixin],
@@ -298,35 +535,34 @@ class CountBuilder(BaseBuilder):
 
         参数:
             model_class: 要计数的模型类
-            count_column: 要计数的列（默认为主键ID）
+            count_column: 要计数的列（默认 COUNT(*)）
             include_deleted: 是否包含已软删除的记录（默认False）
         """
         super().__init__(model_cls, session_provider=session_provider)
 
-        # 设置计数列（默认为主键）
-        count_column: InstrumentedAttribute = count_column if count_column is not None else self._model_cls.id
-
-        if is_distinct:
-            expression: Function[Column] = func.count(distinct(count_column))
+        # 构建基础查询，按计数列缓存；未指定计数列时使用 COUNT(*)，主键非空且唯一，结果与按主键计数一致
+        if count_column is None:
+            self._stmt: Select = _blank_count_all(self._model_cls)
+        elif _is_mapped_attribute(count_column):
+            self._stmt: Select = _blank_count(count_column, is_distinct)
         else:
-            expression: Function[Column] = func.count(count_column)
-
-        # 构建基础查询
-        self._stmt: Select = select(expression)
+            self._stmt: Select = _build_count(count_column, is_distinct)
 
         # 默认过滤已删除记录
-        if include_deleted is False and self._model_cls.has_deleted_at_column():
+        if include_deleted is False and self._model_cls._has_deleted_at:
             self._apply_delete_at_is_none()
 
     @property
     def count_stmt(self) -> Select:
+        self._apply_pending()
         return self._stmt
 
     async def count(self) -> int:
-        async with self._session_provider() as sess:
+        self._apply_pending()
+        async with self._session() as sess:
             try:
                 exec_result = await sess.execute(self._stmt)
-                data = exec_result.scalar()
+                data = exec_result.scalar_one()
             except Exception as e:
                 logger.error(f"{self._model_cls.__name__} count error: {e}")
                 raise
@@ -334,6 +570,8 @@ class CountBuilder(BaseBuilder):
 
 
 class UpdateBuilder(BaseBuilder):
+    __slots__ = ("_update_dict", "_values_applied")
+
     def __init__(
             self,
             *,
@@ -354,40 +592,37 @@ class UpdateBuilder(BaseBuilder):
         """
         # 参数校验
         if (model_cls is None) == (model_ins is None):
-            raise Exception("must and can only provide one of model_class or model_instance")
+            raise ValueError("must and can only provide one of model_class or model_instance")
 
         # 调用父类初始化
         super().__init__(model_cls if model_cls is not None else model_ins.__class__, session_provider=session_provider)
 
         # 初始化更新语句
-        self._stmt: Update = update(self._model_cls)
+        self._stmt: Update = _blank_update(self._model_cls)
         self._update_dict = {}
+        self._values_applied = False
 
         # 如果是实例更新，添加ID条件
         if model_ins is not None:
-            model_id_column: InstrumentedAttribute = self._model_cls.get_column_or_none("id")
-            self._stmt = self._stmt.where(model_id_column == model_ins.id)
+            self._pending_where.append(self._model_cls._id_col == model_ins.id)
 
     def update(self, **kwargs) -> "UpdateBuilder":
         if not kwargs:
             return self
 
-        for column_name, value in kwargs.items():
-            if not self._model_cls.has_column(column_name):
-                continue
-
-            if isinstance(value, datetime) and value.tzinfo is not None:
-                value = value.replace(tzinfo=None)
-
-            self._update_dict[column_name] = value
-
+        column_names = self._model_cls._column_names
+        self._update_dict.update(
+            (column_name, _naive_datetime(value))
+            for column_name, value in kwargs.items()
+            if column_name in column_names
+        )
         return self
 
     def soft_delete(self):
-        if not self._model_cls.has_deleted_at_column():
+        if self._model_cls._deleted_at_name is None:
             return self
 
-        self._update_dict[self._model_cls.deleted_at_column_name()] = get_utc_without_tzinfo()
+        self._update_dict[self._model_cls._deleted_at_name] = get_utc_without_tzinfo()
         return self
 
     @property
@@ -399,79 +634,97 @@ class UpdateBuilder(BaseBuilder):
         3. 如果涉及软删除字段，同步更新时间
         4. 自动设置更新人字段（如果模型支持）
         """
-        # 如果没有需要更新的字段，直接返回原始语句
+        self._apply_pending()
+
+        # 如果没有新的更新字段，直接返回当前语句
         if not self._update_dict:
             return self._stmt
 
-        # 获取当前UTC时间（无时区信息，线程安全）
-        current_time = get_utc_without_tzinfo()
-
-        # 获取模型定义的更新时间字段名
-        updated_at_column_name = self._model_cls.updated_at_column_name()
+        # 将更新字典按字段名排序后应用到SQL语句，调用顺序不同时语句缓存键保持一致
+        update_dict = self._fill_audit_fields(self._update_dict)
+        self._stmt = self._stmt.values(dict(sorted(update_dict.items())))
 
-        # 特殊处理：如果更新中包含软删除字段（逻辑删除）
-        # 则将软删除时间同步到更新时间字段（保持时间一致）
-        if (deleted_at_column_name := self._model_cls.deleted_at_column_name()) in self._update_dict:
-            self._update_dict.setdefault(
-                updated_at_column_name,
-                self._update_dict[deleted_at_column_name]
-            )
-
-        # 设置/更新 更新时间字段（如果未设置）
-        self._update_dict.setdefault(updated_at_column_name, current_time)
-
-        user_id = get_user_id_context_var()
-        # 如果模型支持更新人字段，自动设置当前用户ID
-        if self._model_cls.has_updater_id_column():
-            self._update_dict.setdefault(
-                self._model_cls.updater_id_column_name(),
-                user_id  # 从上下文获取当前用户ID
-            )
-
-        # 将更新字典应用到SQL语句
-        self._stmt = self._stmt.values(**self._update_dict).execution_options(synchronize_session=False)
+        # 字段值已写入语句，释放字典中的引用，重复访问时也不会再次生成语句
+        self._update_dict = {}
+        self._values_applied = True
 
         return self._stmt
 
-    async def execute(self):
-        if not self._update_dict:
+    def _fill_audit_fields(self, values: dict) -> dict:
+        """补全更新时间、更新人字段，调用方已设置的字段不覆盖"""
+        model_cls = self._model_cls
+
+        # 设置更新时间字段（如果未设置），仅在需要时才取当前时间
+        updated_at_name = model_cls._updated_at_name
+        if updated_at_name is not None and updated_at_name not in values:
+            # 特殊处理：如果更新中包含软删除字段（逻辑删除），则将软删除时间同步到更新时间字段（保持时间一致）
+            if model_cls._deleted_at_name in values:
+                values[updated_at_name] = values[model_cls._deleted_at_name]
+            else:
+                values[updated_at_name] = get_utc_without_tzinfo()
+
+        # 如果模型支持更新人字段且未设置，从上下文获取当前用户ID
+        updater_id_name = model_cls._updater_id_name
+        if updater_id_name is not None and updater_id_name not in values:
+            values[updater_id_name] = get_user_id_context_var()
+
+        return values
+
+    async def execute(self) -> int:
+        """执行更新，返回受影响的行数"""
+        if not self._update_dict and not self._values_applied:
             logger.warning(f"{self._model_cls.__name__} no update data")
-            return
+            return 0
 
-        async with self._session_provider() as sess:
-            try:
-                await sess.execute(self.update_stmt)
-                await sess.commit()
-            except Exception as e:
-                logger.error(f"{self._model_cls.__name__} execute update_stmt failed: {e}")
-                raise
+        try:
+            async with self._session(commit=True) as sess:
+                result = await sess.execute(self.update_stmt, execution_options=_sync_options(sess))
+        except Exception as e:
+            logger.error(f"{self._model_cls.__name__} execute update_stmt failed: {e}")
+            raise
+        return result.rowcount
 
+    async def execute_many(self, rows: list[dict]):
+        """按主键批量更新，多行数据在一次 executemany 中提交
 
-def _validate_model_cls(model_cls: type, expected_type: type = type, subclass_of: type = ModelMixin):
-    """校验 model_cls 是否为指定的类型且是指定类的子类"""
-    if model_cls is None:
-        raise Exception("model_cls cannot be None")
+        已通过 where 等方法添加的条件会一并生效，update() 中设置的字段不参与
 
-    if not isinstance(model_cls, expected_type):
-        raise Exception(
-            f"model_cls must be a {expected_type.__name__}, got {type(model_cls).__name__}"
-        )
+        Args:
+            rows: 每行必须包含主键 id，其余键为要更新的字段
 
-    if not issubclass(model_cls, subclass_of):
-        raise Exception(
-            f"model_cls must be a subclass of {subclass_of.__name__}, got {model_cls.__name__}"
-        )
+        示例:
+        await new_cls_updater(User, session_provider=get_session).execute_many([
+            {"id": 1, "username": "Alice"},
+            {"id": 2, "username": "Bob"},
+        ])
+        """
+        if not rows:
+            return
 
+        column_names = self._model_cls._column_names
+        params = [
+            self._fill_audit_fields({k: _naive_datetime(v) for k, v in row.items() if k in column_names})
+            for row in rows
+        ]
+        self._apply_pending()
+        try:
+            async with self._session(commit=True) as sess:
+                await sess.execute(self._stmt, params, execution_options=_sync_options(sess))
+        except Exception as e:
+            logger.error(f"{self._model_cls.__name__} execute_many failed: {e}")
+            raise
 
-def _validate_model_ins(model_ins: object, expected_type: type = ModelMixin):
-    """校验 model_ins 是否为指定的类型且不是 None"""
-    if model_ins is None:
-        raise Exception("model_ins cannot be None")
 
-    if not isinstance(model_ins, expected_type):
-        raise Exception(
-            f"model_ins must be a {expected_type.__name__} instance, got {type(model_ins).__name__}"
-        )
+def _validate_model_cls(model_cls: type):
+    """校验 model_cls 是否为 ModelMixin 的子类，错误信息仅在校验失败时构造"""
+    if not (isinstance(model_cls, type) and issubclass(model_cls, ModelMixin)):
+        raise TypeError(f"model_cls must be a subclass of ModelMixin, got {model_cls!r}")
+
+
+def _validate_model_ins(model_ins: object):
+    """校验 model_ins 是否为 ModelMixin 的实例"""
+    if not isinstance(model_ins, ModelMixin):
+        raise TypeError(f"model_ins must be a ModelMixin instance, got {type(model_ins).__name__}")
 
 
 def new_cls_querier(
@@ -489,7 +742,6 @@ def new_cls_querier(
     返回:
         查询器实例
     """
-    _validate_model_cls(model_cls)
     return QueryBuilder(
         model_cls=model_cls,
         initial_where=initial_where,
@@ -543,7 +795,6 @@ def new_custom_querier(
     返回:
         查询器实例
     """
-    _validate_model_cls(model_cls)
     return QueryBuilder(
         model_cls=model_cls,
         include_deleted=include_deleted,
@@ -561,12 +812,11 @@ def new_cls_updater(model_cls: type[ModelMixin], *, session_provider: SessionPro
         session_provider:
 
     Raises:
-        Exception: 当输入无效时返回500错误
+        TypeError: 当输入无效时抛出，由请求日志中间件统一转换为500响应
 
     Returns:
         UpdateBuilder: 更新器实例
     """
-    _validate_model_cls(model_cls)
     return UpdateBuilder(model_cls=model_cls, session_provider=session_provider)
 
 
@@ -578,7 +828,7 @@ def new_ins_updater(model_ins: ModelMixin, *, session_provider: SessionProvider)
         session_provider:
 
     Raises:
-        Exception: 当输入无效时返回500错误
+        TypeError: 当输入无效时抛出，由请求日志中间件统一转换为500响应
 
     Returns:
         UpdateBuilder: 更新器实例
@@ -602,7 +852,6 @@ def new_counter(
     返回:
         计数器实例
     """
-    _validate_model_cls(model_cls)
     return CountBuilder(model_cls=model_cls, session_provider=session_provider, include_deleted=include_deleted)
 
 
@@ -623,7 +872,6 @@ def new_col_counter(
     返回:
         计数器实例
     """
-    _validate_model_cls(model_cls)
     return CountBuilder(
         model_cls=model_cls,
         count_column=count_column,
@@ -631,3 +879,33 @@ def new_col_counter(
         include_deleted=include_deleted,
         is_distinct=is_distinct
     )
+
+
+async def get_by_id(
+        model_cls: type[MixinModelType],
+        primary_id: Any,
+        *,
+        session_provider: SessionProvider,
+        include_deleted: bool = False
+) -> MixinModelType | None:
+    """按主键获取记录
+
+    使用 AsyncSession.get，先查会话的 identity map，未命中才发出 SQL；
+    在 session_scope 内重复获取同一条记录时不再访问数据库；
+    同一会话中经构建器执行的 UPDATE 会同步 identity map（见 _sync_options），软删除判断不会读到旧值
+
+    参数:
+        model_cls: 要查询的模型类
+        primary_id: 主键值
+        include_deleted: 是否包含已软删除的记录 (默认False)
+    """
+    _validate_model_cls(model_cls)
+
+    async with resolve_session(session_provider) as sess:
+        ins = await sess.get(model_cls, primary_id)
+
+    # 软删除的记录视为不存在
+    if ins is not None and include_deleted is False and model_cls._has_deleted_at:
+        if getattr(ins, model_cls._deleted_at_name) is not None:
+            return None
+    return ins
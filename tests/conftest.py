@@ -0,0 +1,51 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+
+# 导入 internal.config.setting 时按 ENV 选择配置文件，测试默认使用 configs/.env.test
+os.environ.setdefault("ENV", "test")
+
+
+@pytest.fixture
+def run_with_db(tmp_path):
+    """在独立的 SQLite 库上运行 main(session_provider, opened)，opened 记录 session_provider 打开过的会话
+
+    使用临时文件而不是内存库，每个会话各自持有连接，与 MySQL 连接池的行为一致
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from internal.infra.db import Base
+    from pkg.context_tool import set_user_id_context_var
+
+    def _run(main):
+        async def _wrapper():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+            # WAL 模式下读写互不阻塞，流式读取未结束时其它连接也能提交
+            event.listen(engine.sync_engine, "connect", lambda conn, _: conn.execute("PRAGMA journal_mode=WAL"))
+            session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+            opened = []
+
+            @asynccontextmanager
+            async def session_provider(autoflush: bool = True):
+                async with session_maker() as sess:
+                    opened.append(sess)
+                    try:
+                        yield sess
+                    except Exception:
+                        await sess.rollback()
+                        raise
+
+            set_user_id_context_var(7)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            try:
+                await main(session_provider, opened)
+            finally:
+                await engine.dispose()
+
+        asyncio.run(_wrapper())
+
+    return _run
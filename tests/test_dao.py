@@ -0,0 +1,60 @@
+"""BaseDao 在 session_scope 内外的读写测试，使用临时 SQLite 库"""
+import pytest
+
+from internal.dao.user import UserDao
+from internal.infra.db import session_scope
+from internal.models.user import User
+from internal.utils.exception import AppException
+
+
+def test_query_by_id_or_exec_then_update_inside_session_scope(run_with_db):
+    async def main(sp, opened):
+        dao = UserDao(session_provider=sp)
+        user = User.create(username="u0", account="a0")
+        await user.save(session_provider=sp)
+
+        async with session_scope(sp) as sess:
+            loaded = await dao.query_by_id_or_exec(user.id)
+            await loaded.update(account="a0-new")
+            # 同一会话内按主键再次获取命中 identity map
+            assert await dao.query_by_id_or_exec(user.id) is loaded
+            await dao.query_by_id_or_exec(user.id, creator_id=7)
+            assert opened[-1] is sess
+
+        assert (await dao.query_by_id_or_exec(user.id)).account == "a0-new"
+
+    run_with_db(main)
+
+
+def test_query_by_id_or_exec_skips_soft_deleted(run_with_db):
+    async def main(sp, _opened):
+        dao = UserDao(session_provider=sp)
+        user = User.create(username="u0")
+        await user.save(session_provider=sp)
+
+        async with session_scope(sp):
+            loaded = await dao.query_by_id_or_exec(user.id)
+            await loaded.soft_delete()
+            with pytest.raises(AppException):
+                await dao.query_by_id_or_exec(user.id)
+
+        assert (await dao.query_by_id_or_exec(user.id, include_deleted=True)).deleted_at is not None
+
+    run_with_db(main)
+
+
+def test_query_by_id_or_exec_after_builder_soft_delete_inside_session_scope(run_with_db):
+    async def main(sp, _opened):
+        dao = UserDao(session_provider=sp)
+        user = User.create(username="u0")
+        await user.save(session_provider=sp)
+
+        async with session_scope(sp):
+            loaded = await dao.query_by_id_or_exec(user.id)
+            await dao.ins_updater(loaded).soft_delete().execute()
+            # identity map 中的对象已同步 deleted_at，按主键获取与 querier 的结果一致
+            with pytest.raises(AppException):
+                await dao.query_by_id_or_exec(user.id)
+            assert await dao.querier.eq_(User.id, user.id).first() is None
+
+    run_with_db(main)
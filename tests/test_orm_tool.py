@@ -0,0 +1,192 @@
+"""orm_tool 构建器与 ModelMixin 持久化方法在 session_scope 内的协作测试，使用临时 SQLite 库"""
+import pytest
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+
+from internal.infra.db import get_session, session_scope
+from internal.models.user import User
+from pkg.orm_tool import _blank_count, new_cls_querier, new_cls_updater, new_col_counter, new_counter
+
+
+def test_session_scope_shares_session_between_builders_and_model_methods(run_with_db):
+    async def main(sp, opened):
+        async with session_scope(sp) as sess:
+            user = User.create(username="u0", account="a0", phone="13800000000")
+            await user.save(session_provider=sp)
+            await User.add_all_dict(
+                [{"username": "u1", "account": "a1"}, {"username": "u2", "account": "a2"}], session_provider=sp
+            )
+
+            # 同一作用域内查询出的实例挂在共享会话上，可直接调用 update
+            loaded = await new_cls_querier(User, session_provider=sp).eq_(User.username, "u0").first()
+            assert loaded is user
+            await loaded.update(session_provider=sp, account="a0-new")
+
+            await new_cls_updater(User, session_provider=sp).eq_(User.username, "u1").update(phone="1").execute()
+            to_delete = await new_cls_querier(User, session_provider=sp).eq_(User.username, "u2").first()
+            await to_delete.soft_delete()
+
+            assert await new_counter(User, session_provider=sp, include_deleted=False).count() == 2
+            assert opened == [sess]
+
+        rows = await new_cls_querier(User, session_provider=sp, include_deleted=True).asc_(User.username).all()
+        assert [(u.username, u.account, u.phone, u.deleted_at is None) for u in rows] == [
+            ("u0", "a0-new", "13800000000", True),
+            ("u1", "a1", "1", True),
+            ("u2", "a2", None, False),
+        ]
+
+    run_with_db(main)
+
+
+def test_get_session_and_nested_scope_reuse_scoped_session(run_with_db):
+    async def main(sp, opened):
+        async with session_scope(sp) as sess:
+            async with get_session() as inner:
+                assert inner is sess
+            async with session_scope(sp) as nested:
+                assert nested is sess
+                await User.create(username="u0").save()
+            assert opened == [sess]
+
+        assert await new_counter(User, session_provider=sp, include_deleted=False).count() == 1
+
+    run_with_db(main)
+
+
+def test_session_scope_rolls_back_all_writes_on_error(run_with_db):
+    async def main(sp, _opened):
+        with pytest.raises(RuntimeError):
+            async with session_scope(sp):
+                await User.create(username="u0").save(session_provider=sp)
+                await new_cls_updater(User, session_provider=sp).eq_(User.username, "u0").update(account="x").execute()
+                raise RuntimeError("abort")
+
+        assert await new_counter(User, session_provider=sp, include_deleted=False).count() == 0
+
+    run_with_db(main)
+
+
+def test_model_methods_outside_session_scope_commit_immediately(run_with_db):
+    async def main(sp, opened):
+        user = User.create(username="u0")
+        await user.save(session_provider=sp)
+        await user.update(session_provider=sp, account="a0")
+
+        loaded = await new_cls_querier(User, session_provider=sp).eq_(User.id, user.id).first()
+        assert loaded.account == "a0"
+        assert len(opened) == 3
+
+    run_with_db(main)
+
+
+def test_stream_all_releases_connection_on_early_break(run_with_db):
+    async def main(sp, _opened):
+        await User.add_all_dict([{"username": f"u{i}"} for i in range(5)], session_provider=sp)
+
+        querier = new_cls_querier(User, session_provider=sp).asc_(User.username)
+        async with querier.stream_all(yield_per=2) as users:
+            async for user in users:
+                if user.username == "u1":
+                    break
+
+        async with session_scope(sp):
+            async with new_cls_querier(User, session_provider=sp).stream_all(yield_per=2) as users:
+                async for _ in users:
+                    break
+            # 提前退出后共享会话仍可继续使用
+            assert await new_counter(User, session_provider=sp).count() == 5
+
+        assert user.username == "u1"
+
+    run_with_db(main)
+
+
+def test_to_dict_skips_columns_not_loaded(run_with_db):
+    async def main(sp, _opened):
+        await User.create(username="u0", account="a0").save(session_provider=sp)
+
+        user = await new_cls_querier(User, session_provider=sp).load_only_(User.id, User.username).first()
+        data = user.to_dict()
+        assert data["username"] == "u0" and "account" not in data
+        assert "username" not in user.to_dict(exclude_column=["username"])
+
+        user = await new_cls_querier(User, session_provider=sp).defer_(User.account).first()
+        assert "account" not in user.to_dict() and user.to_dict()["username"] == "u0"
+
+        assert User.create(username="u1").to_dict()["deleted_at"] is None
+
+        # 过期的列不会被静默丢弃
+        async with session_scope(sp) as sess:
+            user = await new_cls_querier(User, session_provider=sp).first()
+            sess.expire(user, ["account"])
+            with pytest.raises(Exception):
+                user.to_dict()
+
+    run_with_db(main)
+
+
+def test_col_counter_caches_only_mapped_columns(run_with_db):
+    async def main(sp, _opened):
+        await User.add_all_dict([{"username": "u0"}, {"username": "u0"}, {"username": "u1"}], session_provider=sp)
+
+        _blank_count.cache_clear()
+        for _ in range(3):
+            counter = new_col_counter(User, count_column=User.username, is_distinct=True, session_provider=sp)
+            assert await counter.count() == 2
+            assert await new_col_counter(User, count_column=func.lower(User.username), session_provider=sp).count() == 3
+            new_col_counter(User, count_column=aliased(User).id, session_provider=sp)
+        assert _blank_count.cache_info().currsize == 1
+
+    run_with_db(main)
+
+
+def test_group_by_skips_duplicate_columns():
+    querier = new_cls_querier(User, session_provider=get_session)
+    querier.group_by_(User.account, User.account).group_by_(User.phone)
+    querier.select_stmt
+    querier.group_by_(User.account, User.phone)
+
+    group_by = str(querier.select_stmt).split("GROUP BY", 1)[1]
+    assert group_by.count("account") == 1 and group_by.count("phone") == 1
+
+
+def test_builder_update_refreshes_identity_map_inside_session_scope(run_with_db):
+    async def main(sp, _opened):
+        await User.add_all_dict([{"username": "u0", "account": "a"}, {"username": "u1", "account": "b"}],
+                                session_provider=sp)
+
+        async with session_scope(sp):
+            user = await new_cls_querier(User, session_provider=sp).eq_(User.username, "u0").first()
+            other = await new_cls_querier(User, session_provider=sp).eq_(User.username, "u1").first()
+
+            await new_cls_updater(User, session_provider=sp).eq_(User.id, user.id).update(account="NEW").execute()
+            reread = await new_cls_querier(User, session_provider=sp).eq_(User.id, user.id).first()
+            assert reread is user and reread.account == "NEW"
+
+            await new_cls_updater(User, session_provider=sp).execute_many([{"id": other.id, "account": "MANY"}])
+            assert (await new_cls_querier(User, session_provider=sp).eq_(User.id, other.id).first()).account == "MANY"
+
+    run_with_db(main)
+
+
+def test_stream_all_rows_can_be_updated_while_streaming(run_with_db):
+    async def main(sp, opened):
+        await User.add_all_dict([{"username": f"u{i}"} for i in range(5)], session_provider=sp)
+
+        async with session_scope(sp) as sess:
+            # 流式读取另开会话，不占用作用域会话的连接，循环中的写入仍走作用域会话
+            async with new_cls_querier(User, session_provider=sp).stream_all(yield_per=2) as users:
+                async for user in users:
+                    assert user not in sess
+                    await user.update(account="scoped")
+            assert opened[-1] is sess
+
+        async with new_cls_querier(User, session_provider=sp).stream_all(yield_per=2) as users:
+            async for user in users:
+                await user.update(session_provider=sp, phone="1")
+
+        rows = await new_cls_querier(User, session_provider=sp).all()
+        assert {(u.account, u.phone) for u in rows} == {("scoped", "1")}
+
+    run_with_db(main)